@@ -3,6 +3,7 @@ import github_api_toolkit
 import policy_checks
 
 import json
+import gzip
 import boto3
 import os
 import logging
@@ -104,15 +105,16 @@ def handler(event, context):
 
     logger.info("S3 Client Created")
 
-    s3.put_object(Bucket=bucket_name, Key="repositories.json", Body=json.dumps(repos, indent=4).encode("utf-8"))
+    # The JSON is uploaded gzip compressed to reduce the size of the objects and the time taken for the dashboard to download them
+    s3.put_object(Bucket=bucket_name, Key="repositories.json", Body=gzip.compress(json.dumps(repos, indent=4).encode("utf-8")), ContentType="application/json", ContentEncoding="gzip")
 
     logger.info("Uploaded Repositories JSON to S3")
 
-    s3.put_object(Bucket=bucket_name, Key="secret_scanning.json", Body=json.dumps(secret_scanning_alerts, indent=4).encode("utf-8"))
+    s3.put_object(Bucket=bucket_name, Key="secret_scanning.json", Body=gzip.compress(json.dumps(secret_scanning_alerts, indent=4).encode("utf-8")), ContentType="application/json", ContentEncoding="gzip")
 
     logger.info("Uploaded Secret Scanning JSON to S3")
 
-    s3.put_object(Bucket=bucket_name, Key="dependabot.json", Body=json.dumps(dependabot_alerts, indent=4).encode("utf-8"))
+    s3.put_object(Bucket=bucket_name, Key="dependabot.json", Body=gzip.compress(json.dumps(dependabot_alerts, indent=4).encode("utf-8")), ContentType="application/json", ContentEncoding="gzip")
 
     logger.info("Uploaded Dependabot JSON to S3")
 
@@ -5,10 +5,17 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import orjson
 
 import os
 import json
-from datetime import datetime, timedelta
+import gzip
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.exceptions import ClientError
@@ -16,6 +23,15 @@ from botocore.exceptions import ClientError
 account = os.getenv("AWS_ACCOUNT_NAME")
 bucket_name = f"{account}-github-audit-dashboard"
 
+# Local directory used to cache the parsed S3 objects as Parquet files
+cache_directory = os.path.join(tempfile.gettempdir(), "github-audit-dashboard")
+
+# Columns of the repository DataFrame that aren't rules
+repository_columns = ["repository", "repository_type", "url", "rule_flags"]
+
+# The rule_flags bitmap is a uint64, so it can only hold this many rules
+max_rules = 64
+
 st.set_page_config(page_title="GitHub Audit Dashboard", page_icon="./src/branding/ONS-symbol_digital.svg", layout="wide")
 st.logo("./src/branding/ONS_Logo_Digital_Colour_Landscape_Bilingual_RGB.svg")
 
@@ -26,47 +42,379 @@ def get_s3_client() -> boto3.client:
     return s3
 
 
-def get_table_from_s3(s3, bucket_name: str, object_name: str) -> pd.DataFrame | str:
+def get_cached_etag(cache_path: str) -> str | None:
+    """
+        Gets the S3 ETag stored in the metadata of a cached Parquet file.
+
+        Args:
+            cache_path: The path of the cached Parquet file.
+        Returns:
+            The ETag of the S3 object the file was created from.
+            or
+            None if the file does not exist or cannot be read.
+    """
+    try:
+        metadata = pq.read_schema(cache_path).metadata or {}
+    except (OSError, pa.ArrowException):
+        return None
+
+    etag = metadata.get(b"etag")
+
+    return etag.decode("utf-8") if etag else None
+
+def write_parquet_cache(df: pd.DataFrame, cache_path: str, etag: str) -> None:
+    """
+        Writes a DataFrame to a Parquet file, storing the S3 ETag in the file's metadata.
+
+        Caching is best effort, so any error writing the file is ignored.
+
+        Args:
+            df: The DataFrame to cache.
+            cache_path: The path of the Parquet file to write.
+            etag: The ETag of the S3 object the DataFrame was created from.
+    """
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b"etag": etag.encode("utf-8")})
+
+        os.makedirs(cache_directory, exist_ok=True)
+
+        # Write to a temporary file first so other sessions never read a partially written cache
+        file_descriptor, temp_path = tempfile.mkstemp(dir=cache_directory, suffix=".tmp")
+        os.close(file_descriptor)
+
+        try:
+            pq.write_table(table, temp_path, compression="zstd")
+            os.replace(temp_path, cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    except (OSError, pa.ArrowException):
+        pass
+
+def get_table_from_s3(s3, bucket_name: str, object_name: str) -> pd.DataFrame:
     """
         Gets a JSON file from an S3 bucket and returns it as a Pandas DataFrame.
 
+        The parsed DataFrame is cached locally as a Parquet file.
+        If the object in S3 has not changed since it was cached, the Parquet file is read instead of downloading the JSON again.
+
         Args:
             s3: A boto3 S3 client.
             bucket_name: The name of the S3 bucket.
             object_name: The name of the object in the S3 bucket.
         Returns:
             A Pandas DataFrame containing the data from the JSON file.
-            or
-            A string containing an error message.
+        Raises:
+            ClientError: If the object could not be retrieved from the S3 bucket.
     """
+    cache_path = os.path.join(cache_directory, f"{object_name.removesuffix('.json')}.parquet")
+    cached_etag = get_cached_etag(cache_path)
+
+    request = {"Bucket": bucket_name, "Key": object_name}
+
+    # Only download the object if it doesn't match the cached copy
+    if cached_etag is not None:
+        request["IfNoneMatch"] = cached_etag
+
     try:
-        response = s3.get_object(Bucket=bucket_name, Key=object_name)
+        response = s3.get_object(**request)
     except ClientError as e:
-        return (f"An error occurred when getting {object_name} data: {e}")
+        if e.response["ResponseMetadata"]["HTTPStatusCode"] != 304:
+            raise
+
+        # S3 responds with 304 Not Modified when the ETag matches, so the cached copy is up to date
+        try:
+            return pd.read_parquet(cache_path)
+        except (OSError, pa.ArrowException):
+            # The cached copy has been removed or can't be read, so download the object without the ETag
+            # The cache is rewritten below, so later loads don't keep getting a 304 for a broken file
+            response = s3.get_object(Bucket=bucket_name, Key=object_name)
     
-    json_data = json.loads(response["Body"].read().decode("utf-8"))
+    body = response["Body"].read()
+
+    # Objects uploaded with gzip Content-Encoding aren't decompressed by boto3, so decompress them here
+    if response.get("ContentEncoding") == "gzip":
+        body = gzip.decompress(body)
+
+    # orjson parses the raw bytes directly, skipping the intermediate decode to str
+    json_data = orjson.loads(body)
+
+    # Flatten the nested checklist into "checklist.<rule>" keys (the same columns pd.json_normalize would produce)
+    # The other records are already flat, so they can go straight into DataFrame.from_records
+    for record in json_data:
+        if "checklist" in record:
+            record.update({f"checklist.{rule}": value for rule, value in record.pop("checklist").items()})
 
-    return pd.json_normalize(json_data)
+    df = pd.DataFrame.from_records(json_data)
+
+    write_parquet_cache(df, cache_path, response["ETag"])
+
+    return df
+
+def get_rules(df_repositories: pd.DataFrame) -> list[str]:
+    """
+        Gets the rules from the repository DataFrame, in the order of their bits in the rule_flags column.
+
+        Args:
+            df_repositories (pd.DataFrame): The repository DataFrame returned by load_data.
+        Returns:
+            list[str]: The names of the rules.
+    """
+    return [column for column in df_repositories.columns if column not in repository_columns]
 
 @st.cache_data
-def load_data(load_date: datetime.date):
+def load_data(load_date: int):
     """
         Loads the data from the S3 bucket and returns it as a Pandas DataFrame.
 
         This function is cached using Streamlit's @st.cache_data decorator.
+        Errors are raised rather than returned, so a failed load isn't cached and is retried on the next rerun.
 
         Args:
-            load_date (date): The date and time the data was loaded.
+            load_date (int): The 10 minute window the data was loaded in.
+        Raises:
+            RuntimeError: If any of the objects could not be retrieved from the S3 bucket, naming the object that failed.
+            ValueError: If there are more rules than fit in the rule_flags bitmap.
     """
     
     s3 = get_s3_client()
 
-    df_repositories = get_table_from_s3(s3, bucket_name, "repositories.json")
-    df_secret_scanning = get_table_from_s3(s3, bucket_name, "secret_scanning.json")
-    df_dependabot = get_table_from_s3(s3, bucket_name, "dependabot.json")
+    object_names = ["repositories.json", "secret_scanning.json", "dependabot.json"]
+
+    # Fetch the objects in parallel so the load time is the slowest request rather than the sum of all three
+    # boto3 clients are thread-safe, so the cached client can be shared between the workers
+    with ThreadPoolExecutor(max_workers=len(object_names)) as executor:
+        futures = [executor.submit(get_table_from_s3, s3, bucket_name, object_name) for object_name in object_names]
+
+    tables = []
+
+    for object_name, future in zip(object_names, futures):
+        try:
+            tables.append(future.result())
+        except ClientError as e:
+            # The ClientError only names the operation, so add which object couldn't be retrieved
+            raise RuntimeError(f"An error occurred when getting {object_name} data: {e}") from e
+
+    df_repositories, df_secret_scanning, df_dependabot = tables
+
+    # Converts the DataFrames into the form used by the dashboard
+    # This is done here so it only runs once per data refresh, rather than on every rerun
+
+    # Renames the repository columns and removes the "checklist." prefix from the rules
+    df_repositories.columns = ["repository", "repository_type", "url"] + df_repositories.columns[3:].str.removeprefix("checklist.").to_list()
+
+    rules = get_rules(df_repositories)
+    df_repositories[rules] = df_repositories[rules].astype(bool)
+
+    # Shifting a uint64 past bit 63 wraps around, so more rules would silently share bits
+    if len(rules) > max_rules:
+        raise ValueError(f"There are {len(rules)} rules, but the rule_flags bitmap can only hold {max_rules}.")
+
+    # Packs the rules into a single bitmap column, where bit i is set if the repository breaks the ith rule (in the order given by get_rules)
+    # This means the rules broken for any selection can be counted with one AND and popcount per repository
+    rule_flags = np.zeros(len(df_repositories), dtype=np.uint64)
+
+    for i, rule in enumerate(rules):
+        rule_flags |= df_repositories[rule].to_numpy(dtype=np.uint64) << np.uint64(i)
+
+    df_repositories["rule_flags"] = rule_flags
+
+    # Repository type only has a few values, so a categorical compares codes rather than strings when filtering
+    df_repositories["repository_type"] = df_repositories["repository_type"].astype("category")
+
+    df_secret_scanning.columns = ["Repository Name", "Type", "Secret", "Link"]
+
+    df_dependabot.columns = ["Repository Name", "Type", "Dependency", "Advisory", "Severity", "Days Open", "Link"]
+
+    # An ordered categorical lets severity be sorted and aggregated (i.e max) without mapping it to a weight
+    df_dependabot["Severity"] = pd.Categorical(df_dependabot["Severity"], categories=["low", "medium", "high", "critical"], ordered=True)
 
     return df_repositories, df_secret_scanning, df_dependabot
 
+def filter_repository_type(df_repositories: pd.DataFrame, repository_type: str) -> pd.DataFrame:
+    """
+        Filters the repository DataFrame by repository type.
+
+        Args:
+            df_repositories (pd.DataFrame): The repository DataFrame returned by load_data.
+            repository_type (str): The repository type to filter by, or "all" for every repository.
+        Returns:
+            pd.DataFrame: The repositories of the given type.
+    """
+    if repository_type == "all":
+        return df_repositories
+
+    return df_repositories.loc[df_repositories["repository_type"] == repository_type]
+
+@st.cache_data(ttl=600, max_entries=20)
+def compute_repository_view(_df_repositories: pd.DataFrame, selected_rules: tuple, repository_type: str, load_date: int) -> tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
+    """
+        Works out the compliance of each repository against the selected rules.
+
+        This function is cached using Streamlit's @st.cache_data decorator.
+        The DataFrame isn't hashed, so the cache is keyed on the selected rules, repository type and load date instead.
+        This means reruns from unrelated widgets (i.e selecting a repository) don't redo the calculation.
+        Entries expire with the 10 minute data refresh and at most 20 selections are kept, so the cache doesn't grow without limit.
+
+        Args:
+            _df_repositories (pd.DataFrame): The repository DataFrame returned by load_data.
+            selected_rules (tuple): The rules to check for.
+            repository_type (str): The repository type to filter by, or "all" for every repository.
+            load_date (int): The 10 minute window the data was loaded in.
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame, pd.Series]: The repositories with their compliance, a summary of the compliance and the number of repositories breaking each rule.
+    """
+    # Maps each rule to its bit in the rule_flags column
+    rule_index = {rule: i for i, rule in enumerate(get_rules(_df_repositories))}
+
+    # Gets the selected rules in the order they appear in the DataFrame
+    # Using a set keeps each membership check constant time
+    selected_rules = set(selected_rules)
+    rules_checked = [rule for rule in rule_index if rule in selected_rules]
+
+    # Builds a bitmask of the selected rules, matching the bits in the rule_flags column
+    rule_mask = np.uint64(sum(1 << rule_index[rule] for rule in rules_checked))
+
+    # Filter the DataFrame by the selected repository type
+    df_repositories_filtered = filter_repository_type(_df_repositories, repository_type)
+
+    # Count the number of selected rules broken by each repository
+    rules_broken = np.bitwise_count(df_repositories_filtered["rule_flags"].to_numpy() & rule_mask)
+
+    # Select only the columns for the selected rules
+    # This is copied so the loaded data is never modified
+    df_repositories_filtered = df_repositories_filtered[["repository", "repository_type", "url", *rules_checked]].copy()
+
+    # Create a new column to check if the repository is compliant or not
+    # If any check is True, the repository is non-compliant
+    df_repositories_filtered["is_compliant"] = rules_broken == 0
+
+    # Create a new column for the number of rules broken
+    df_repositories_filtered["rules_broken"] = rules_broken
+
+    # Sort the DataFrame by the number of rules broken and the repository name
+    df_repositories_filtered = df_repositories_filtered.sort_values(by=["rules_broken", "repository"], ascending=[False, True])
+
+    # Rename the columns of the DataFrame
+    df_repositories_filtered.columns = ["Repository", "Repository Type", "URL"] + rules_checked + ["Is Compliant", "Rules Broken"]
+
+    # Create a dataframe summarising the compliance of the repositories
+    df_compliance = df_repositories_filtered["Is Compliant"].value_counts().reset_index()
+
+    df_compliance["Is Compliant"] = np.where(df_compliance["Is Compliant"], "Compliant", "Non-Compliant")
+
+    df_compliance.columns = ["Compliance", "Number of Repositories"]
+
+    rule_frequency = df_repositories_filtered[rules_checked].sum()
+
+    return df_repositories_filtered, df_compliance, rule_frequency
+
+@st.cache_resource(max_entries=2)
+def group_by_repository(_df_alerts: pd.DataFrame, alert_type: str, load_date: int) -> dict[tuple[str, str], pd.DataFrame]:
+    """
+        Splits an alerts DataFrame into a dictionary of DataFrames for each repository.
+
+        This function is cached using Streamlit's @st.cache_resource decorator, so the same dictionary is shared between reruns without being copied.
+        The DataFrame isn't hashed, so the cache is keyed on the alert type and load date instead.
+        The DataFrames in the dictionary must not be modified.
+
+        Args:
+            _df_alerts (pd.DataFrame): The alerts DataFrame returned by load_data.
+            alert_type (str): The type of alerts in the DataFrame (either secret_scanning or dependabot).
+            load_date (int): The 10 minute window the data was loaded in.
+        Returns:
+            dict[tuple[str, str], pd.DataFrame]: The alerts for each repository, keyed by repository name and type.
+    """
+    return dict(list(_df_alerts.groupby(["Repository Name", "Type"], sort=False)))
+
+def get_dependabot_mask(df_dependabot: pd.DataFrame, severity: list[str], minimum_days: int) -> np.ndarray:
+    """
+        Gets a boolean mask of the dependabot alerts with one of the given severities, open for at least the minimum number of days.
+
+        Severity is compared using its integer category codes rather than the severity strings.
+
+        Args:
+            df_dependabot (pd.DataFrame): The dependabot alerts DataFrame.
+            severity (list[str]): The severity levels to include.
+            minimum_days (int): The minimum number of days an alert has been open.
+        Returns:
+            np.ndarray: True for each alert that matches the filters.
+    """
+    allowed_codes = df_dependabot["Severity"].cat.categories.get_indexer(severity)
+
+    return np.isin(df_dependabot["Severity"].cat.codes.to_numpy(), allowed_codes) & (df_dependabot["Days Open"].to_numpy() >= minimum_days)
+
+@st.cache_data(ttl=600, max_entries=20)
+def compute_dependabot_view(_df_dependabot: pd.DataFrame, severity: tuple, repository_type: str, minimum_days: int, load_date: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+        Filters the dependabot alerts and summarises them by repository and by severity.
+
+        This function is cached using Streamlit's @st.cache_data decorator.
+        The DataFrame isn't hashed, so the cache is keyed on the filters and load date instead.
+        This means reruns from unrelated widgets (i.e selecting a repository) don't redo the calculation.
+        Entries expire with the 10 minute data refresh and at most 20 filter combinations are kept, so the cache doesn't grow without limit.
+
+        Args:
+            _df_dependabot (pd.DataFrame): The dependabot DataFrame returned by load_data.
+            severity (tuple): The severity levels to include.
+            repository_type (str): The repository type to filter by, or "all" for every repository.
+            minimum_days (int): The minimum number of days an alert has been open.
+            load_date (int): The 10 minute window the data was loaded in.
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The alerts grouped by repository and the number of alerts for each severity.
+    """
+    # Filter the DataFrame by the selected severity levels and the minimum days open
+    df_dependabot_filtered = _df_dependabot.loc[get_dependabot_mask(_df_dependabot, list(severity), minimum_days)]
+
+    # Filter the DataFrame by the selected repository type
+    if repository_type != "all":
+        df_dependabot_filtered = df_dependabot_filtered.loc[df_dependabot_filtered["Type"] == repository_type]
+
+    # Group the DataFrame by the repository name and the type
+    # As severity is an ordered categorical, max gives the highest severity for each repository
+    df_dependabot_grouped = df_dependabot_filtered.groupby(["Repository Name", "Type"], observed=True).agg(**{
+        "Number of Alerts": ("Dependency", "size"),
+        "Max Severity": ("Severity", "max"),
+        "Max Days Open": ("Days Open", "max")
+    }).reset_index()
+
+    # Sort the grouped DataFrame by the severity and the days open
+    df_dependabot_grouped.sort_values(by=["Max Severity", "Max Days Open"], ascending=[False, False], inplace=True)
+
+    # Capitalise the severity levels for display
+    # This only renames the categories, rather than every row
+    df_dependabot_grouped["Max Severity"] = df_dependabot_grouped["Max Severity"].cat.rename_categories(str.capitalize)
+
+    # Create a dataframe summarising the alerts by severity
+    df_dependabot_severity_grouped = df_dependabot_filtered.groupby("Severity", observed=True).count().reset_index()[["Severity", "Repository Name"]]
+    df_dependabot_severity_grouped.columns = ["Severity", "Number of Alerts"]
+
+    return df_dependabot_grouped, df_dependabot_severity_grouped
+
+def create_pie_chart(df: pd.DataFrame, values: str, names: str, title: str | None = None, threshold: int = 50) -> go.Figure:
+    """
+        Creates a pie chart, or a horizontal bar chart if there are too many slices for a pie chart to stay readable and responsive.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to plot.
+            values (str): The column containing the size of each slice.
+            names (str): The column containing the name of each slice.
+            title (str, optional): The title of the chart. Defaults to None.
+            threshold (int, optional): The maximum number of slices to show as a pie chart. Defaults to 50.
+        Returns:
+            go.Figure: The chart.
+    """
+    if len(df) > threshold:
+        return px.bar(df, x=values, y=names, orientation="h", title=title)
+
+    fig = px.pie(df, values=values, names=names, title=title)
+
+    # The data is already in the order it should be shown, so Plotly doesn't need to sort the slices
+    fig.update_traces(sort=False)
+
+    return fig
+
 @st.cache_data
 def load_file(filename: str) -> dict:
     """Loads a JSON file and returns it as a dictionary.
@@ -84,30 +432,40 @@ def load_file(filename: str) -> dict:
 
     return file_json
 
+@st.cache_resource
+def get_rulemap(filename: str) -> dict[str, tuple]:
+    """Loads the rulemap and splits the rules into the groups used by the dashboard.
 
-loading_date = datetime.now()
+    This function is cached using Streamlit's @st.cache_resource decorator.
+    The rulemap is static, so the same object is shared between reruns without being copied.
 
-# Rounds loading_date to the nearest 10 minutes
-# This means the cached data will refresh every 10 minutes
+    Args:
+        filename (str): The path of the rulemap JSON file.
 
-loading_date = loading_date.strftime("%Y-%m-%d %H:%M")
-loading_date = loading_date[:-1] + "0"
+    Returns:
+        dict[str, tuple]: The names of all, security and policy rules, and a (name, description) pair for each rule.
+    """
+    rulemap = load_file(filename)
 
-df_repositories, df_secret_scanning, df_dependabot = load_data(loading_date)
+    return {
+        "all": tuple(rule["name"] for rule in rulemap),
+        "security": tuple(rule["name"] for rule in rulemap if rule["is_security_rule"]),
+        "policy": tuple(rule["name"] for rule in rulemap if rule["is_policy_rule"]),
+        "descriptions": tuple((rule["name"], rule["description"]) for rule in rulemap)
+    }
 
-rulemap = load_file("rulemap.json")
 
-if type(df_repositories) == str:
-    st.error(df_repositories)
-    st.stop()
+# Rounds loading_date down to the nearest 10 minutes (as the number of 10 minute windows since the epoch)
+# This means the cached data will refresh every 10 minutes
+loading_date = int(time.time() // 600)
 
-if type(df_secret_scanning) == str:
-    st.error(df_secret_scanning)
+try:
+    df_repositories, df_secret_scanning, df_dependabot = load_data(loading_date)
+except RuntimeError as e:
+    st.error(str(e))
     st.stop()
 
-if type(df_dependabot) == str: 
-    st.error(df_dependabot)
-    st.stop()
+rulemap = get_rulemap("rulemap.json")
 
 
 col1, col2 = st.columns([0.8, 0.2])
@@ -126,22 +484,12 @@ with repository_tab:
     st.header(":blue-background[Repository Analysis]")
     
     # Gets the rules from the repository DataFrame
-    rules = df_repositories.columns.to_list()[3:]
-
-    # Cleans the rules to remove the "checklist." prefix
-    for i in range(len(rules)):
-        rules[i] = rules[i].replace("checklist.", "")
-
-    # Renames the columns of the DataFrame
-    df_repositories.columns = ["repository", "repository_type", "url"] + rules
+    rules = get_rules(df_repositories)
 
     # Uses streamlit's session state to store the selected rules
     # This is so that selected rules persist with other inputs (i.e the preset buttons)
     if "selected_rules" not in st.session_state:
-        st.session_state["selected_rules"] = []
-        
-        for rule in rulemap:
-            st.session_state["selected_rules"].append(rule["name"])
+        st.session_state["selected_rules"] = list(rulemap["all"])
 
     # Preset Buttons
     
@@ -149,19 +497,11 @@ with repository_tab:
 
     with col1:
         if st.button("Security Preset", use_container_width=True):
-            st.session_state["selected_rules"] = []
-
-            for rule in rulemap:
-                if rule["is_security_rule"]:
-                    st.session_state["selected_rules"].append(rule["name"])
+            st.session_state["selected_rules"] = list(rulemap["security"])
 
     with col2:
         if st.button("Policy Preset", use_container_width=True):
-            st.session_state["selected_rules"] = []
-
-            for rule in rulemap:
-                if rule["is_policy_rule"]:
-                    st.session_state["selected_rules"].append(rule["name"])
+            st.session_state["selected_rules"] = list(rulemap["policy"])
 
     selected_rules = st.multiselect("Select rules", rules, st.session_state["selected_rules"])
 
@@ -169,32 +509,8 @@ with repository_tab:
 
     # If any rules are selected, populate the rest of the dashboard
     if len(selected_rules) != 0:
-        rules_to_exclude = []
-
-        for rule in rules:
-            if rule not in selected_rules:
-                rules_to_exclude.append(rule)
-
-        # Remove the columns for rules that aren't selected
-        df_repositories = df_repositories.drop(columns=rules_to_exclude)
-
-        # Filter the DataFrame by the selected repository type
-        if repository_type != "all":
-            df_repositories = df_repositories.loc[df_repositories["repository_type"] == repository_type]
-
-        # Create a new column to check if the repository is compliant or not
-        # If any check is True, the repository is non-compliant
-        df_repositories["is_compliant"] = df_repositories.any(axis="columns", bool_only=True)
-        df_repositories["is_compliant"] = df_repositories["is_compliant"].apply(lambda x: not x)
-
-        # Create a new column to count the number of rules broken
-        df_repositories["rules_broken"] = df_repositories[selected_rules].sum(axis="columns")
-        
-        # Sort the DataFrame by the number of rules broken and the repository name
-        df_repositories = df_repositories.sort_values(by=["rules_broken", "repository"], ascending=[False, True])
-
-        # Rename the columns of the DataFrame
-        df_repositories.columns = ["Repository", "Repository Type", "URL"] + selected_rules + ["Is Compliant", "Rules Broken"]
+        # Sorting the rules means the same selection hits the cache whatever order the rules were picked in
+        df_repositories_filtered, df_compliance, rule_frequency = compute_repository_view(df_repositories, tuple(sorted(selected_rules)), repository_type, loading_date)
 
         st.subheader(":blue-background[Repository Compliance]")
 
@@ -203,17 +519,14 @@ with repository_tab:
 
         col1, col2 = st.columns(2)
 
-        for i in range(0, len(selected_rules)):
-            if i % 2 == 0:
-                col1.write(f"- {selected_rules[i].replace('_', ' ').title()}")
-            else:
-                col2.write(f"- {selected_rules[i].replace('_', ' ').title()}")
+        # Each column is written as a single markdown list, rather than one element per rule
+        col1.markdown("\n".join(f"- {rule.replace('_', ' ').title()}" for rule in selected_rules[::2]))
+        col2.markdown("\n".join(f"- {rule.replace('_', ' ').title()}" for rule in selected_rules[1::2]))
 
         with st.expander("See Rule Descriptions"):
             st.subheader("Rule Descriptions")
             
-            for rule in rulemap:
-                st.write(f"- {rule['name'].replace('_', ' ').title()}: {rule['description']}")
+            st.markdown("\n".join(f"- {name.replace('_', ' ').title()}: {description}" for name, description in rulemap["descriptions"]))
 
             st.caption("**Note:** All rules are interpreted from ONS' [GitHub Usage Policy](https://officenationalstatistics.sharepoint.com/sites/ONS_DDaT_Communities/Software%20Engineering%20Policies/Forms/AllItems.aspx?id=%2Fsites%2FONS%5FDDaT%5FCommunities%2FSoftware%20Engineering%20Policies%2FSoftware%20Engineering%20Policies%2FApproved%2FPDF%2FGitHub%20Usage%20Policy%2Epdf&parent=%2Fsites%2FONS%5FDDaT%5FCommunities%2FSoftware%20Engineering%20Policies%2FSoftware%20Engineering%20Policies%2FApproved%2FPDF).")
 
@@ -221,16 +534,9 @@ with repository_tab:
 
         col1, col2 = st.columns(2)
 
-        # Create a dataframe summarising the compliance of the repositories
-        df_compliance = df_repositories["Is Compliant"].value_counts().reset_index()
-
-        df_compliance["Is Compliant"] = df_compliance["Is Compliant"].apply(lambda x: "Compliant" if x else "Non-Compliant")
-
-        df_compliance.columns = ["Compliance", "Number of Repositories"]
-
         # Create a pie chart to show the compliance of the repositories
         with col1:
-            fig = px.pie(df_compliance, values="Number of Repositories", names="Compliance")
+            fig = create_pie_chart(df_compliance, values="Number of Repositories", names="Compliance")
 
             st.plotly_chart(fig)
 
@@ -248,16 +554,15 @@ with repository_tab:
 
             st.metric("Compliant Repositories", compliant_repositories)
             st.metric("Non-Compliant Repositories", noncompliant_repositories)
-            st.metric("Average Rules Broken", int(df_repositories["Rules Broken"].mean().round(0)))
+            st.metric("Average Rules Broken", int(df_repositories_filtered["Rules Broken"].mean().round(0)))
 
-            rule_frequency = df_repositories[selected_rules].sum()
             st.metric("Most Common Rule Broken", rule_frequency.idxmax().replace("_", " ").title())
 
         # Display the repositories that are non-compliant
         st.subheader(":blue-background[Non-Compliant Repositories]")
 
         selected_repo = st.dataframe(
-            df_repositories[["Repository", "Repository Type", "Rules Broken"]].loc[df_repositories["Is Compliant"] == 0],
+            df_repositories_filtered[["Repository", "Repository Type", "Rules Broken"]].loc[df_repositories_filtered["Is Compliant"] == 0],
             on_select="rerun",
             selection_mode=["single-row"],
             use_container_width=True,
@@ -268,19 +573,19 @@ with repository_tab:
         if len(selected_repo["selection"]["rows"]) > 0:
             selected_repo = selected_repo["selection"]["rows"][0]
 
-            selected_repo = df_repositories.iloc[selected_repo]
+            selected_repo = df_repositories_filtered.iloc[selected_repo]
 
-            failed_checks = selected_repo[3:-2].loc[selected_repo[3:-2] == 1]
+            # Get the selected rules that the repository breaks
+            failed_checks = [rule for rule, is_broken in zip(selected_rules, selected_repo[selected_rules].to_numpy(dtype=bool)) if is_broken]
 
             col1, col2 = st.columns([0.8, 0.2])
 
             col1.subheader(f":blue-background[{selected_repo["Repository"]} ({selected_repo["Repository Type"].capitalize()})]")
             col2.write(f"[Go to Repository]({selected_repo['URL']})")
 
-            st.subheader("Rules Broken:")      
+            st.subheader("Rules Broken:")
 
-            for check in failed_checks.index:
-                st.write(f"- {check.replace('_', ' ').title()}")  
+            st.markdown("\n".join(f"- {check.replace('_', ' ').title()}" for check in failed_checks))
         else:
             st.caption("Select a repository for more information.")
 
@@ -296,14 +601,9 @@ with slo_tab:
     st.subheader(":blue-background[Secret Scanning Alerts]")
     st.write("Alerts open for more than 5 days.")
 
-    # Rename the columns of the DataFrame
-    df_secret_scanning.columns = ["Repository Name", "Type", "Secret", "Link"]
-
-    # Group the DataFrame by the repository name and the type
-    df_secret_scanning_grouped = df_secret_scanning.groupby(["Repository Name", "Type"]).count().reset_index()
-
-    # Rename the columns of the grouped DataFrame
-    df_secret_scanning_grouped.columns = ["Repository Name", "Type", "Number of Secrets", "Link"]
+    # Count the number of secrets for each repository name and type
+    # sort=False keeps the grouped order (by repository name) rather than sorting by count
+    df_secret_scanning_grouped = df_secret_scanning.value_counts(["Repository Name", "Type"], sort=False).reset_index(name="Number of Secrets")
 
     col1, col2 = st.columns([0.8, 0.2])
 
@@ -328,7 +628,7 @@ with slo_tab:
         st.subheader(f":blue-background[{selected_secret['Repository Name']} ({selected_secret['Type']})]")
 
         st.dataframe(
-            df_secret_scanning.loc[df_secret_scanning["Repository Name"] == selected_secret["Repository Name"]],
+            group_by_repository(df_secret_scanning, "secret_scanning", loading_date)[(selected_secret["Repository Name"], selected_secret["Type"])],
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -346,9 +646,6 @@ with slo_tab:
     st.subheader(":blue-background[Dependabot Alerts]")
     st.write("Alerts open for more than 5 days (Critical), 15 days (High), 60 days (Medium), 90 days (Low).")    
 
-    # Rename the columns of the DataFrame
-    df_dependabot.columns = ["Repository Name", "Type", "Dependency", "Advisory", "Severity", "Days Open", "Link"]
-
     col1, col2 = st.columns([0.7, 0.3])
 
     severity = col1.multiselect("Alert Severity", ["critical", "high", "medium", "low"], ["critical", "high", "medium", "low"])
@@ -357,37 +654,14 @@ with slo_tab:
 
     # If any severity levels are selected, populate the rest of the dashboard
     if len(severity) > 0:
-        # Filter the DataFrame by the selected severity levels and the minimum days open
-        df_dependabot = df_dependabot.loc[df_dependabot["Severity"].isin(severity) & (df_dependabot["Days Open"] >= minimum_days)]
-
-        # Filter the DataFrame by the selected repository type
-        if repo_type != "all":
-            df_dependabot = df_dependabot.loc[df_dependabot["Type"] == repo_type]
-
-        # Map the severity to a weight for sorting
-        df_dependabot["Severity Weight"] = df_dependabot["Severity"].map({"critical": 4, "high": 3, "medium": 2, "low": 1})
-
-        # Group the DataFrame by the repository name and the type
-        df_dependabot_grouped = df_dependabot.groupby(["Repository Name", "Type"]).agg({"Dependency": "count", "Severity Weight": "max", "Days Open": "max"}).reset_index()
-        
-        # Create a new column to map the severity weight to a severity level for the grouped data
-        df_dependabot_grouped["Severity"] = df_dependabot_grouped["Severity Weight"].map({4: "Critical", 3: "High", 2: "Medium", 1: "Low"})
-
-        # Rename the columns of the grouped DataFrame
-        df_dependabot_grouped.columns = ["Repository Name", "Type", "Number of Alerts", "Severity Weight", "Max Days Open", "Max Severity"]
-
-        # Sort the grouped DataFrame by the severity weight and the days open
-        df_dependabot_grouped.sort_values(by=["Severity Weight", "Max Days Open"], ascending=[False, False], inplace=True)
+        # Sorting the severity levels means the same selection hits the cache whatever order they were picked in
+        df_dependabot_grouped, df_dependabot_severity_grouped = compute_dependabot_view(df_dependabot, tuple(sorted(severity)), repo_type, minimum_days, loading_date)
 
         col1, col2 = st.columns([0.7, 0.3])
 
         with col1:
-            # Create a dataframe summarising the alerts by severity
-            df_dependabot_severity_grouped = df_dependabot.groupby("Severity").count().reset_index()[["Severity", "Repository Name"]]
-            df_dependabot_severity_grouped.columns = ["Severity", "Number of Alerts"]
-
             # Create a pie chart to show the alerts by severity
-            fig = px.pie(
+            fig = create_pie_chart(
                 df_dependabot_severity_grouped,
                 names="Severity",
                 values="Number of Alerts",
@@ -420,9 +694,13 @@ with slo_tab:
 
             st.subheader(f":blue-background[{selected_repo['Repository Name']} ({selected_repo['Type']})]")
 
+            # Get the alerts for the selected repository and apply the same filters as the table above
+            df_repository_alerts = group_by_repository(df_dependabot, "dependabot", loading_date)[(selected_repo["Repository Name"], selected_repo["Type"])]
+            df_repository_alerts = df_repository_alerts.loc[get_dependabot_mask(df_repository_alerts, severity, minimum_days)]
+
             st.dataframe(
-                # Get the alerts for the selected repository, sort by severity weight and days open and display the columns
-                df_dependabot.loc[df_dependabot["Repository Name"] == selected_repo["Repository Name"]].sort_values(by=["Severity Weight", "Days Open"], ascending=[False, False])[["Repository Name", "Dependency", "Advisory", "Severity", "Days Open", "Link"]],
+                # Sort the alerts by severity and days open and display the columns
+                df_repository_alerts.sort_values(by=["Severity", "Days Open"], ascending=[False, False])[["Repository Name", "Dependency", "Advisory", "Severity", "Days Open", "Link"]],
                 use_container_width=True,
                 hide_index=True,
                 column_config={
@@ -2,6 +2,8 @@ from src.app import get_table_from_s3
 
 import boto3
 import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
 
 def get_s3_client() -> boto3.client:
     session = boto3.Session(profile_name="ons_sdp_sandbox")
@@ -10,27 +12,27 @@ def get_s3_client() -> boto3.client:
 
 def test_invalid_bucket() -> None:
     """
-    Test that the function returns a string when an invalid bucket is provided
+    Test that the function raises a ClientError when an invalid bucket is provided
     """
     s3 = get_s3_client()
 
     bucket = "invalid-bucket"
     object_name = "repositories.json"
-    filename = "repositories.json"
 
-    assert type(get_table_from_s3(s3, bucket, object_name, filename)) == str
+    with pytest.raises(ClientError):
+        get_table_from_s3(s3, bucket, object_name)
 
 def test_invalid_object_name() -> None:
     """
-    Test that the function returns a string when an invalid object name is provided
+    Test that the function raises a ClientError when an invalid object name is provided
     """
     s3 = get_s3_client()
 
     bucket = "sdp-sandbox-github-audit-dashboard"
     object_name = "invalid-object-name"
-    filename = "repositories.json"
 
-    assert type(get_table_from_s3(s3, bucket, object_name, filename)) == str
+    with pytest.raises(ClientError):
+        get_table_from_s3(s3, bucket, object_name)
 
 def test_correct_input() -> None:
     """
@@ -40,6 +42,5 @@ def test_correct_input() -> None:
 
     bucket = "sdp-sandbox-github-audit-dashboard"
     object_name = "repositories.json"
-    filename = "repositories.json"
 
-    assert type(get_table_from_s3(s3, bucket, object_name, filename)) == pd.DataFrame
\ No newline at end of file
+    assert type(get_table_from_s3(s3, bucket, object_name)) == pd.DataFrame
\ No newline at end of file